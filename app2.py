@@ -28,28 +28,90 @@ import os
 import re
 import json
 import time
-import string
 import shutil
+import hashlib
 import logging
 import subprocess
-from urllib.parse import urlparse
-from threading import Lock
+from functools import partial
+from threading import Event, Lock, Thread, local
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import count, islice
+from queue import PriorityQueue
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QLabel, QLineEdit, QPushButton,
                              QProgressBar, QFileDialog, QMessageBox, QTextEdit,
                              QScrollArea, QCheckBox, QFrame, QGridLayout, QPlainTextEdit,
                              QTabWidget, QComboBox, QDialog)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QUrl
-from PyQt5.QtGui import QFont, QPixmap, QDesktopServices
+from PyQt5.QtCore import Qt, QObject, QThread, pyqtSignal, QTimer, QUrl, QStandardPaths, QRect
+from PyQt5.QtGui import QColor, QFont, QImage, QPainter, QPixmap, QPixmapCache, QDesktopServices
 import yt_dlp
 import requests
-from io import BytesIO
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from packaging.version import Version, InvalidVersion
+except ImportError:
+    Version = None
+
+try:
+    import instaloader
+    _HAS_INSTALOADER = True
+except ImportError:
+    _HAS_INSTALOADER = False
+
+try:
+    import orjson
+
+    def _dumps(obj, pretty=False):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+except ImportError:
+    def _dumps(obj, pretty=False):
+        if pretty:
+            return json.dumps(obj, indent=2).encode()
+        return json.dumps(obj, separators=(',', ':')).encode()
 
 # Current version
 CURRENT_VERSION = "1.0.0"
 VERSION_CHECK_URL = "https://raw.githubusercontent.com/SpeiiKhiev12/speiikhievdownloader/main/version.json"
 DOWNLOAD_PAGE_URL = "https://github.com/SpeiiKhiev12/speiikhievdownloader/releases/latest"
 
+# Parallel downloads: leave one core free, but cap to avoid server-side throttling
+DEFAULT_MAX_CONCURRENT = max(1, min(4, (os.cpu_count() or 2) - 1))
+
+# Characters not allowed in generated filenames
+_UNSAFE_FILENAME_RE = re.compile(r'[^A-Za-z0-9 _.()\-]')
+_PATH_SEP_TRANS = str.maketrans('', '', '/\\')
+
+# http(s) URL with a host, no '..' and at most 10 slashes in total
+_URL_RE = re.compile(r'^(?!.*\.\.)https?://[^/?#][^/]*(?:/[^/]*){0,8}$', re.I | re.S)
+
+# Instagram profile URL, with or without a leading '@' on the username
+_IG_USERNAME_RE = re.compile(r'instagram\.com/@?([^/?]+)')
+
+# Supported platform hosts, matched in one pass over the lowercased URL
+_PLATFORM_RE = re.compile(r'(tiktok\.com|youtube\.com|youtu\.be|instagram\.com|facebook\.com|fb\.com)')
+_PLATFORM_MAP = {
+    'tiktok.com': 'TikTok',
+    'youtube.com': 'YouTube',
+    'youtu.be': 'YouTube',
+    'instagram.com': 'Instagram',
+    'facebook.com': 'Facebook',
+    'fb.com': 'Facebook',
+}
+
+# Shared HTTP session so version checks and thumbnails reuse TCP/TLS connections
+HTTP = requests.Session()
+HTTP.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                                   max_retries=Retry(total=2, backoff_factor=0.3)))
+
+# Thumbnail hosts warmed at startup so first requests reuse pooled connections.
+# Only stable hosts the HTTP session fetches from; Instagram serves regional
+# scontent-*.cdninstagram.com hosts and yt-dlp uses its own connections.
+PRECONNECT_URLS = [
+    "https://i.ytimg.com/",
+]
+
 # Configure logging
 logging.basicConfig(
     filename='video_downloader.log',
@@ -58,16 +120,166 @@ logging.basicConfig(
 )
 
 
+# Application-wide stylesheet, applied once in main(); per-widget state uses dynamic properties
+STYLE = """
+    QMainWindow, QWidget {
+        background-color: #1a1a1a;
+        color: #ffffff;
+        font-family: 'Segoe UI', Arial;
+    }
+    QLineEdit, QPlainTextEdit {
+        background-color: #2d2d2d;
+        border: 2px solid #3d3d3d;
+        border-radius: 8px;
+        padding: 12px;
+        color: #ffffff;
+    }
+    QLineEdit:focus, QPlainTextEdit:focus { border: 2px solid #0095f6; }
+    QPlainTextEdit#statusLog { padding: 10px; }
+    QPlainTextEdit#statusLog:focus { border: 2px solid #3d3d3d; }
+    QPushButton {
+        background-color: #0095f6;
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 12px 24px;
+        font-weight: bold;
+    }
+    QPushButton:hover { background-color: #0081d8; }
+    QPushButton:disabled { background-color: #3d3d3d; color: #666666; }
+    QPushButton#secondaryBtn { background-color: #3d3d3d; }
+    QPushButton#secondaryBtn:hover { background-color: #4d4d4d; }
+    QPushButton#updateBtn {
+        background-color: #00d26a;
+        color: white;
+    }
+    QPushButton#updateBtn:hover {
+        background-color: #00b85a;
+    }
+    QProgressBar {
+        border: 2px solid #3d3d3d;
+        border-radius: 8px;
+        background-color: #2d2d2d;
+        text-align: center;
+        height: 30px;
+    }
+    QProgressBar::chunk { background-color: #0095f6; border-radius: 6px; }
+    QTextEdit {
+        background-color: #2d2d2d;
+        border: 2px solid #3d3d3d;
+        border-radius: 8px;
+        padding: 10px;
+        color: #ffffff;
+    }
+
+    QTabWidget::pane {
+        border: 2px solid #3d3d3d;
+        border-radius: 8px;
+        background-color: #1a1a1a;
+    }
+    QTabBar::tab {
+        background-color: #2d2d2d;
+        color: #ffffff;
+        padding: 10px 20px;
+        margin-right: 2px;
+        border-top-left-radius: 8px;
+        border-top-right-radius: 8px;
+    }
+    QTabBar::tab:selected {
+        background-color: #0095f6;
+    }
+    QTabBar::tab:hover {
+        background-color: #3d3d3d;
+    }
+
+    VideoWidget {
+        background-color: #2d2d2d;
+        border: 2px solid #3d3d3d;
+        border-radius: 8px;
+        padding: 10px;
+    }
+    VideoWidget:hover {
+        border: 2px solid #0095f6;
+    }
+    QFrame#cardState {
+        border-radius: 8px;
+    }
+    QFrame#cardState[state="downloaded"] {
+        background-color: #1a3a2a;
+        border: 2px solid #00d26a;
+    }
+    QFrame#cardState[state="failed"] {
+        background-color: #3a1a1a;
+        border: 2px solid #ff4444;
+    }
+    VideoPlaceholder {
+        background-color: #2d2d2d;
+        border: 2px solid #3d3d3d;
+        border-radius: 8px;
+    }
+    VideoWidget QCheckBox::indicator {
+        width: 20px;
+        height: 20px;
+        border-radius: 4px;
+        border: 2px solid #0095f6;
+        background-color: #2d2d2d;
+    }
+    VideoWidget QCheckBox::indicator:checked {
+        background-color: #0095f6;
+    }
+    QLabel#thumbnail {
+        background-color: #1a1a1a;
+        border-radius: 4px;
+    }
+    QLabel#statusIndicator {
+        background-color: rgba(0, 0, 0, 0.7);
+        color: white;
+        font-size: 11px;
+        font-weight: bold;
+        padding: 4px 8px;
+        border-radius: 4px;
+    }
+    QLabel#statusIndicator[state="downloaded"] { background-color: #00d26a; }
+    QLabel#statusIndicator[state="failed"] { background-color: #ff4444; }
+    QLabel#videoTitle { color: #ffffff; font-size: 12px; font-weight: bold; }
+    QLabel#videoUrl { color: #8e8e8e; font-size: 10px; }
+    QLabel#downloadedCounter, QLabel#failedCounter { color: #8e8e8e; font-weight: bold; }
+    QLabel#downloadedCounter[active="true"] { color: #00d26a; }
+    QLabel#failedCounter[active="true"] { color: #ff4444; }
+    QLabel#diskSpace { color: #8e8e8e; font-size: 10px; }
+    QLabel#diskSpace[level="low"] { color: #ff4444; font-weight: bold; }
+    QLabel#diskSpace[level="warn"] { color: #ff9500; font-weight: bold; }
+    QLabel#diskSpace[level="ok"] { color: #00d26a; font-weight: bold; }
+"""
+
+
+def _short(s, n, suffix='…'):
+    """Shorten s to at most n characters, ending in a one-character ellipsis"""
+    return s if len(s) <= n else s[:n - len(suffix)] + suffix
+
+
+def set_style_state(widget, name, value):
+    """Set a dynamic property used by STYLE and re-polish the widget only if it changed"""
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
+
 class Config:
     """Configuration manager for persistent settings"""
+    SAVE_DELAY_MS = 1000
+
     def __init__(self):
         self.config_file = 'downloader_config.json'
         self.state_file = 'download_state.json'
+        self._dirty = False
         self.load()
 
     def load(self):
         try:
-            with open(self.config_file, 'r') as f:
+            with open(self.config_file, 'rb') as f:
                 self.data = json.load(f)
         except:
             self.data = {
@@ -75,18 +287,45 @@ class Config:
                 'max_videos': 50,
                 'filename_format': 0,
                 'rate_limit_delay': 2,
+                'instagram_delay': 0.5,
+                'max_concurrent': DEFAULT_MAX_CONCURRENT,
                 'check_updates': True,
                 'last_update_check': 0
             }
             self.save()
 
+    def _write_json(self, path, obj):
+        """Write JSON to a temp file and swap it in, so a crash never leaves a partial file"""
+        tmp = path + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(_dumps(obj, self.data.get('pretty_json', False)))
+        os.replace(tmp, path)
+
     def save(self):
+        self._dirty = False
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.data, f, indent=2)
+            self._write_json(self.config_file, self.data)
         except Exception as e:
             logging.error(f"Failed to save config: {e}")
 
+    def set(self, key, value):
+        """Update a setting and schedule a deferred save"""
+        if self.data.get(key) == value:
+            return
+        self.data[key] = value
+        self.mark_dirty()
+
+    def mark_dirty(self):
+        """Schedule a save; repeated calls before it fires share one write"""
+        if not self._dirty:
+            self._dirty = True
+            QTimer.singleShot(self.SAVE_DELAY_MS, self.flush)
+
+    def flush(self):
+        """Write pending changes to disk"""
+        if self._dirty:
+            self.save()
+
     def save_state(self, videos, downloaded_ids):
         """Save current download state"""
         try:
@@ -95,15 +334,14 @@ class Config:
                 'downloaded': downloaded_ids,
                 'timestamp': time.time()
             }
-            with open(self.state_file, 'w') as f:
-                json.dump(state, f, indent=2)
+            self._write_json(self.state_file, state)
         except Exception as e:
             logging.error(f"Failed to save state: {e}")
 
     def load_state(self):
         """Load previous download state"""
         try:
-            with open(self.state_file, 'r') as f:
+            with open(self.state_file, 'rb') as f:
                 return json.load(f)
         except:
             return None
@@ -115,18 +353,7 @@ class SecurityUtils:
     @staticmethod
     def is_valid_url(url):
         """Validate URL format and scheme"""
-        try:
-            result = urlparse(url)
-            if result.scheme not in ['http', 'https']:
-                return False
-            if not result.netloc:
-                return False
-            if '..' in url or url.count('/') > 10:
-                return False
-            return True
-        except Exception as e:
-            logging.warning(f"URL validation failed: {e}")
-            return False
+        return bool(_URL_RE.match(url))
 
     @staticmethod
     def sanitize_filename(filename):
@@ -134,9 +361,8 @@ class SecurityUtils:
         if not filename:
             return "video"
 
-        filename = filename.replace('..', '').replace('/', '').replace('\\', '')
-        valid_chars = f"-_.() {string.ascii_letters}{string.digits}"
-        sanitized = ''.join(c if c in valid_chars else '_' for c in filename)
+        filename = filename.translate(_PATH_SEP_TRANS).replace('..', '')
+        sanitized = _UNSAFE_FILENAME_RE.sub('_', filename)
         sanitized = sanitized.strip('. ')
         sanitized = os.path.basename(sanitized)
 
@@ -177,7 +403,7 @@ class VersionCheckThread(QThread):
     def run(self):
         try:
             # Check version from GitHub or your server
-            response = requests.get(VERSION_CHECK_URL, timeout=10)
+            response = HTTP.get(VERSION_CHECK_URL, timeout=10)
 
             if response.status_code == 200:
                 version_data = response.json()
@@ -199,6 +425,12 @@ class VersionCheckThread(QThread):
 
     def is_newer_version(self, latest, current):
         """Compare version strings (e.g., '2.0.0' > '1.0.0')"""
+        if Version is not None:
+            try:
+                return Version(latest) > Version(current)
+            except InvalidVersion:
+                return False
+
         try:
             latest_parts = [int(x) for x in latest.split('.')]
             current_parts = [int(x) for x in current.split('.')]
@@ -317,49 +549,46 @@ class UpdateDialog(QDialog):
             QMessageBox.critical(self, "Error", f"Failed to open browser: {e}")
 
 
-class ProfileFetchThread(QThread):
+class ThrottledEmitMixin:
+    """Rate-limits per-item signals so worker loops don't flood the GUI event loop"""
+    EMIT_INTERVAL = 0.1
+    _last_emit = 0.0
+
+    def _should_emit(self):
+        now = time.monotonic()
+        if now - self._last_emit < self.EMIT_INTERVAL:
+            return False
+        self._last_emit = now
+        return True
+
+
+class ProfileFetchThread(ThrottledEmitMixin, QThread):
     progress = pyqtSignal(int)
     finished = pyqtSignal(bool, str, list)
     status_update = pyqtSignal(str)
 
-    def __init__(self, url, max_videos=50):
+    def __init__(self, url, max_videos=50, rate_limit_delay=0.5):
         super().__init__()
         self.url = url
         self.max_videos = max_videos
+        self.rate_limit_delay = rate_limit_delay
         self._is_running = True
 
     def stop(self):
         self._is_running = False
 
     def detect_platform(self, url):
-        url_lower = url.lower()
-        if 'tiktok.com' in url_lower:
-            return 'TikTok'
-        elif 'youtube.com' in url_lower or 'youtu.be' in url_lower:
-            return 'YouTube'
-        elif 'instagram.com' in url_lower:
-            return 'Instagram'
-        elif 'facebook.com' in url_lower or 'fb.com' in url_lower:
-            return 'Facebook'
-        return 'Unknown'
+        match = _PLATFORM_RE.search(url.lower())
+        return _PLATFORM_MAP[match.group(1)] if match else 'Unknown'
 
     def extract_instagram_username(self, url):
-        patterns = [
-            r'instagram\.com/([^/\?]+)',
-            r'instagram\.com/@([^/\?]+)',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                username = match.group(1)
-                username = username.split('?')[0].strip('/')
-                return username
+        match = _IG_USERNAME_RE.search(url)
+        if match:
+            return match.group(1).strip('/')
         return None
 
     def scrape_instagram_with_instaloader(self, username):
         try:
-            import instaloader
-
             self.status_update.emit("Using instaloader for Instagram...")
 
             L = instaloader.Instaloader(
@@ -370,6 +599,8 @@ class ProfileFetchThread(QThread):
                 download_comments=False,
                 save_metadata=False,
                 compress_json=False,
+                request_timeout=30.0,
+                max_connection_attempts=3,
             )
 
             profile = instaloader.Profile.from_username(L.context, username)
@@ -378,16 +609,11 @@ class ProfileFetchThread(QThread):
             self.status_update.emit(f"Total posts: {profile.mediacount}")
 
             videos = []
-            count = 0
 
-            for post in profile.get_posts():
+            for n, post in enumerate(islice(profile.get_posts(), self.max_videos), 1):
                 if not self._is_running:
                     break
 
-                if count >= self.max_videos:
-                    break
-                count += 1
-
                 if post.is_video:
                     video_url = f"https://www.instagram.com/p/{post.shortcode}/"
 
@@ -401,11 +627,14 @@ class ProfileFetchThread(QThread):
                         'like_count': post.likes,
                     }
                     videos.append(video_info)
-                    self.status_update.emit(f"Found video {len(videos)}: {post.shortcode}")
 
-                progress = 60 + int((count / self.max_videos) * 30)
-                self.progress.emit(progress)
-                time.sleep(0.5)
+                if self._should_emit():
+                    if post.is_video:
+                        self.status_update.emit(f"Found video {len(videos)}: {post.shortcode}")
+                    self.progress.emit(60 + int((n / self.max_videos) * 30))
+
+                if post.is_video and self.rate_limit_delay > 0:
+                    time.sleep(self.rate_limit_delay)
 
             return videos
 
@@ -422,13 +651,7 @@ class ProfileFetchThread(QThread):
             self.progress.emit(10)
 
             if platform == 'Instagram':
-                try:
-                    import instaloader
-                    instagram_available = True
-                except ImportError:
-                    instagram_available = False
-
-                if instagram_available:
+                if _HAS_INSTALOADER:
                     username = self.extract_instagram_username(self.url)
                     if not username:
                         self.finished.emit(False, "Could not extract Instagram username from URL", [])
@@ -516,8 +739,8 @@ class ProfileFetchThread(QThread):
                         }
                         videos.append(video_info)
 
-                    progress = 60 + int((idx / len(entries)) * 30)
-                    self.progress.emit(progress)
+                    if self._should_emit():
+                        self.progress.emit(60 + int((idx / len(entries)) * 30))
 
                 self.progress.emit(100)
 
@@ -532,79 +755,111 @@ class ProfileFetchThread(QThread):
             self.finished.emit(False, f"Error: {error_msg}", [])
 
 
-class VideoInfoThread(QThread):
+class VideoInfoThread(ThrottledEmitMixin, QThread):
     progress = pyqtSignal(int)
     finished = pyqtSignal(bool, str, list)
     status_update = pyqtSignal(str)
 
-    def __init__(self, urls):
+    def __init__(self, urls, max_workers=8, ready=None):
         super().__init__()
         self.urls = urls
+        self.ready = ready
+        self.max_workers = max(1, min(max_workers, len(urls) or 1))
+        self._local = local()
+        self._ydl_instances = []
+        self._ydl_lock = Lock()
         self._is_running = True
 
     def stop(self):
         self._is_running = False
 
+    def _get_ydl(self):
+        """Return this worker thread's YoutubeDL, creating it on first use"""
+        ydl = getattr(self._local, 'ydl', None)
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL({
+                'quiet': True,
+                'no_warnings': True,
+                'skip_download': True,
+            })
+            self._local.ydl = ydl
+            with self._ydl_lock:
+                self._ydl_instances.append(ydl)
+        return ydl
+
+    def _extract(self, idx, url):
+        """Extract metadata for one URL; runs on a worker thread of the pool"""
+        if not self._is_running:
+            return None
+
+        try:
+            if not SecurityUtils.is_valid_url(url):
+                self.status_update.emit(f"⚠️ Invalid URL {idx}: Skipping")
+                logging.warning(f"Invalid URL rejected: {url}")
+                return None
+
+            info = self._get_ydl().extract_info(url, download=False)
+
+            if info:
+                title = info.get('title', '')
+                description = info.get('description', '')
+
+                if 'instagram.com' in url:
+                    if description and description != title:
+                        caption_lines = description.split('\n')
+                        title = caption_lines[0] if caption_lines else title
+                        if len(title) > 100:
+                            title = title[:100]
+
+                if not title or title == 'Untitled':
+                    uploader = info.get('uploader', info.get('channel', 'unknown'))
+                    upload_date = info.get('upload_date', '')
+                    if upload_date:
+                        title = f"{uploader}_{upload_date}"
+                    else:
+                        title = f"{uploader}_video"
+
+                return {
+                    'id': info.get('id', '') or info.get('display_id', f'video_{idx}'),
+                    'title': title,
+                    'url': url,
+                    'thumbnail': info.get('thumbnail', ''),
+                    'duration': info.get('duration', 0),
+                    'view_count': info.get('view_count', 0),
+                    'like_count': info.get('like_count', 0),
+                }
+
+        except Exception as e:
+            self.status_update.emit(f"⚠️ Failed: {str(e)[:50]}")
+            logging.error(f"Failed to extract info from {url}: {e}")
+
+        return None
+
     def run(self):
         try:
+            if self.ready is not None:
+                # Let an in-flight warm-up finish rather than duplicating its work
+                self.ready.wait(10)
+
             videos = []
             total = len(self.urls)
 
-            for idx, url in enumerate(self.urls, 1):
-                if not self._is_running:
-                    break
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [executor.submit(self._extract, idx, url)
+                           for idx, url in enumerate(self.urls, 1)]
 
-                try:
-                    if not SecurityUtils.is_valid_url(url):
-                        self.status_update.emit(f"⚠️ Invalid URL {idx}: Skipping")
-                        logging.warning(f"Invalid URL rejected: {url}")
+                # Read results in submission order so the grid keeps the pasted order
+                for idx, future in enumerate(futures, 1):
+                    video_info = future.result()
+                    if not self._is_running:
                         continue
 
-                    self.status_update.emit(f"Extracting info {idx}/{total}...")
-                    self.progress.emit(int((idx / total) * 90))
-
-                    ydl_opts = {
-                        'quiet': True,
-                        'no_warnings': True,
-                        'skip_download': True,
-                    }
+                    if self._should_emit():
+                        self.status_update.emit(f"Extracting info {idx}/{total}...")
+                        self.progress.emit(int((idx / total) * 90))
 
-                    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                        info = ydl.extract_info(url, download=False)
-
-                        if info:
-                            title = info.get('title', '')
-                            description = info.get('description', '')
-
-                            if 'instagram.com' in url:
-                                if description and description != title:
-                                    caption_lines = description.split('\n')
-                                    title = caption_lines[0] if caption_lines else title
-                                    if len(title) > 100:
-                                        title = title[:100]
-
-                            if not title or title == 'Untitled':
-                                uploader = info.get('uploader', info.get('channel', 'unknown'))
-                                upload_date = info.get('upload_date', '')
-                                if upload_date:
-                                    title = f"{uploader}_{upload_date}"
-                                else:
-                                    title = f"{uploader}_video"
-
-                            video_info = {
-                                'id': info.get('id', '') or info.get('display_id', f'video_{idx}'),
-                                'title': title,
-                                'url': url,
-                                'thumbnail': info.get('thumbnail', ''),
-                                'duration': info.get('duration', 0),
-                                'view_count': info.get('view_count', 0),
-                                'like_count': info.get('like_count', 0),
-                            }
-                            videos.append(video_info)
-
-                except Exception as e:
-                    self.status_update.emit(f"⚠️ Failed: {str(e)[:50]}")
-                    logging.error(f"Failed to extract info from {url}: {e}")
+                    if video_info:
+                        videos.append(video_info)
 
             self.progress.emit(100)
 
@@ -616,6 +871,10 @@ class VideoInfoThread(QThread):
         except Exception as e:
             logging.error(f"VideoInfoThread error: {e}")
             self.finished.emit(False, f"Error: {str(e)}", [])
+        finally:
+            for ydl in self._ydl_instances:
+                ydl.close()
+            self._ydl_instances.clear()
 
 
 class DownloadThread(QThread):
@@ -623,123 +882,188 @@ class DownloadThread(QThread):
     finished = pyqtSignal(bool, str, str)
     status_update = pyqtSignal(str)
 
-    def __init__(self, videos, save_path, filename_format=0, rate_limit_delay=2):
+    def __init__(self, videos, save_path, filename_format=0, rate_limit_delay=2,
+                 max_concurrent=DEFAULT_MAX_CONCURRENT):
         super().__init__()
         self.videos = videos
         self.save_path = save_path
         self.filename_format = filename_format
         self.rate_limit_delay = rate_limit_delay
+        self.max_concurrent = max(1, min(max_concurrent, len(videos) or 1))
+        self._lock = Lock()
+        self.success_count = 0
+        self.failed_count = 0
+        self._unstarted = len(videos)
+        self._local = local()
+        self._ydl_instances = []
+        self._existing = []
+        self._reserved = set()
+        self._real_save = save_path
         self._is_running = True
 
     def stop(self):
         self._is_running = False
 
-    def is_already_downloaded(self, video_id, save_path):
-        try:
-            for filename in os.listdir(save_path):
-                if str(video_id) in filename:
-                    return True
-        except:
-            pass
-        return False
+    def is_already_downloaded(self, video_id):
+        """Check the directory listing cached at the start of run()"""
+        video_id = str(video_id)
+        with self._lock:
+            return any(video_id in filename for filename in self._existing)
 
-    def progress_hook(self, d, video_id):
+    def progress_hook(self, state, d):
+        # May run on yt-dlp's fragment threads, so read the per-instance state, not self._local
         if not self._is_running:
             raise Exception("Download cancelled")
 
+        video_id = state['video_id']
+
         if d['status'] == 'downloading':
+            # yt-dlp calls this many times a second; forward at most every 100ms
+            now = time.monotonic()
+            if now - state['last_emit'] < 0.1:
+                return
             if 'downloaded_bytes' in d and 'total_bytes' in d:
+                state['last_emit'] = now
                 percent = (d['downloaded_bytes'] / d['total_bytes']) * 100
                 self.progress.emit(int(percent), video_id)
         elif d['status'] == 'finished':
             self.progress.emit(100, video_id)
 
-    def run(self):
-        try:
-            total = len(self.videos)
-            success_count = 0
-            failed_count = 0
+    def _get_ydl(self):
+        """Return this worker thread's YoutubeDL, creating it on first use"""
+        ydl = getattr(self._local, 'ydl', None)
+        if ydl is None:
+            self._local.state = {'video_id': '', 'last_emit': 0.0}
+            ydl_opts = {
+                'format': 'best',
+                'progress_hooks': [partial(self.progress_hook, self._local.state)],
+                'quiet': True,
+                'no_warnings': True,
+                'buffersize': 64 * 1024,
+                'http_chunk_size': 10 * 1024 * 1024,
+                'concurrent_fragment_downloads': 4,
+            }
+            ydl = yt_dlp.YoutubeDL(ydl_opts)
+            self._local.ydl = ydl
+            with self._lock:
+                self._ydl_instances.append(ydl)
+        return ydl
+
+    def _reserve_filename(self, name):
+        """Claim a name no other worker in this batch is writing to"""
+        with self._lock:
+            candidate, n = name, 2
+            while candidate.lower() in self._reserved:
+                candidate = f'{name}_{n}'
+                n += 1
+            self._reserved.add(candidate.lower())
+        return candidate
+
+    def _download_one(self, idx, video):
+        """Download a single video; runs on a worker thread of the pool"""
+        if not self._is_running:
+            return
+        with self._lock:
+            self._unstarted -= 1
 
-            for idx, video in enumerate(self.videos, 1):
-                if not self._is_running:
-                    break
+        total = len(self.videos)
+        title = video.get('title', '')
+        video_id = video.get('id', '')
 
-                try:
-                    video_id = video['id']
-                    title = video['title']
-                    url = video['url']
+        try:
+            url = video['url']
 
-                    if self.is_already_downloaded(video_id, self.save_path):
-                        success_count += 1
-                        self.finished.emit(True, f"✓ Already exists: {title[:50]}", video_id)
-                        continue
+            if self.is_already_downloaded(video_id):
+                with self._lock:
+                    self.success_count += 1
+                self.finished.emit(True, f"✓ Already exists: {title[:50]}", video_id)
+                return
 
-                    clean_title = SecurityUtils.sanitize_filename(title)
+            clean_title = SecurityUtils.sanitize_filename(title)
 
-                    if self.filename_format == 0:
-                        final_filename = f'{idx:02d}_{clean_title}'
-                    elif self.filename_format == 1:
-                        safe_id = SecurityUtils.sanitize_filename(str(video_id))[:30]
-                        final_filename = safe_id
-                    elif self.filename_format == 2:
-                        safe_id = SecurityUtils.sanitize_filename(str(video_id))[:10]
-                        final_filename = f'{idx:02d}_{clean_title}_{safe_id}'
-                    else:
-                        final_filename = clean_title
+            if self.filename_format == 0:
+                final_filename = f'{idx:02d}_{clean_title}'
+            elif self.filename_format == 1:
+                safe_id = SecurityUtils.sanitize_filename(str(video_id))[:30]
+                final_filename = safe_id
+            elif self.filename_format == 2:
+                safe_id = SecurityUtils.sanitize_filename(str(video_id))[:10]
+                final_filename = f'{idx:02d}_{clean_title}_{safe_id}'
+            else:
+                final_filename = clean_title
 
-                    final_filename = SecurityUtils.sanitize_filename(final_filename)
+            final_filename = self._reserve_filename(final_filename)
 
-                    self.status_update.emit(f"[{idx}/{total}] Downloading: {title[:50]}...")
+            self.status_update.emit(f"[{idx}/{total}] Downloading: {title[:50]}...")
 
-                    output_template = os.path.join(self.save_path, f'{final_filename}.%(ext)s')
-                    output_template = SecurityUtils.sanitize_path(output_template)
+            output_template = os.path.join(self._real_save, f'{final_filename}.%(ext)s')
 
-                    ydl_opts = {
-                        'format': 'best',
-                        'outtmpl': output_template,
-                        'progress_hooks': [lambda d, vid=video_id: self.progress_hook(d, vid)],
-                        'quiet': True,
-                        'no_warnings': True,
-                    }
+            ydl = self._get_ydl()
+            ydl.params['outtmpl']['default'] = output_template
+            self._local.state.update(video_id=video_id, last_emit=0.0)
+            ydl.download([url])
 
-                    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                        ydl.download([url])
+            with self._lock:
+                self.success_count += 1
+                self._existing.append(final_filename)
+            self.finished.emit(True, f"✓ Downloaded: {title[:50]}", video_id)
 
-                    success_count += 1
-                    self.finished.emit(True, f"✓ Downloaded: {title[:50]}", video_id)
+            # Each worker paces its own requests, unless nothing is left for it to pick up
+            with self._lock:
+                more_queued = self._unstarted > 0
+            if more_queued and self.rate_limit_delay > 0 and self._is_running:
+                time.sleep(self.rate_limit_delay)
 
-                    if idx < total and self.rate_limit_delay > 0:
-                        time.sleep(self.rate_limit_delay)
+        except Exception as e:
+            with self._lock:
+                self.failed_count += 1
+            self.finished.emit(False, f"✗ Failed: {title[:50]}", video_id)
+            logging.error(f"Download failed: {e}")
+
+    def run(self):
+        try:
+            self._real_save = SecurityUtils.sanitize_path(self.save_path)
+            self._existing = os.listdir(self._real_save) if os.path.isdir(self._real_save) else []
+            self._reserved.clear()
+            self._unstarted = len(self.videos)
 
-                except Exception as e:
-                    failed_count += 1
-                    self.finished.emit(False, f"✗ Failed: {title[:50]}", video_id)
-                    logging.error(f"Download failed: {e}")
+            with ThreadPoolExecutor(max_workers=self.max_concurrent) as executor:
+                futures = [executor.submit(self._download_one, idx, video)
+                           for idx, video in enumerate(self.videos, 1)]
+                for future in as_completed(futures):
+                    future.result()
 
             if self._is_running:
-                self.status_update.emit(f"\n🎉 Complete! Success: {success_count}, Failed: {failed_count}")
+                self.status_update.emit(f"\n🎉 Complete! Success: {self.success_count}, Failed: {self.failed_count}")
 
         except Exception as e:
             self.status_update.emit(f"Error: {str(e)}")
+        finally:
+            for ydl in self._ydl_instances:
+                ydl.close()
+            self._ydl_instances.clear()
 
 
-class InstagramScraperThread(QThread):
+class InstagramScraperThread(ThrottledEmitMixin, QThread):
     progress = pyqtSignal(int, str)
     finished = pyqtSignal(bool, str, list)
 
-    def __init__(self, username, max_posts=50):
+    def __init__(self, username, max_posts=50, rate_limit_delay=0.5):
         super().__init__()
         self.username = username
         self.max_posts = max_posts
+        self.rate_limit_delay = rate_limit_delay
         self._is_running = True
 
     def stop(self):
         self._is_running = False
 
     def run(self):
-        try:
-            import instaloader
+        if not _HAS_INSTALOADER:
+            self.finished.emit(False, "Instagram scraping requires 'instaloader'.\n\nInstall: pip install instaloader", [])
+            return
 
+        try:
             self.progress.emit(10, "Connecting...")
 
             L = instaloader.Instaloader(
@@ -750,6 +1074,8 @@ class InstagramScraperThread(QThread):
                 download_comments=False,
                 save_metadata=False,
                 compress_json=False,
+                request_timeout=30.0,
+                max_connection_attempts=3,
             )
 
             self.progress.emit(30, f"Fetching: @{self.username}")
@@ -759,19 +1085,19 @@ class InstagramScraperThread(QThread):
             self.progress.emit(50, f"Found: {profile.full_name}")
 
             video_urls = []
-            count = 0
 
-            for post in profile.get_posts():
-                if not self._is_running or count >= self.max_posts:
+            for n, post in enumerate(islice(profile.get_posts(), self.max_posts), 1):
+                if not self._is_running:
                     break
-                count += 1
 
                 if post.is_video:
                     url = f"https://www.instagram.com/p/{post.shortcode}/"
                     video_urls.append(url)
-                    self.progress.emit(50 + int((count / self.max_posts) * 40), f"Found {len(video_urls)} videos")
+                    if self._should_emit():
+                        self.progress.emit(50 + int((n / self.max_posts) * 40), f"Found {len(video_urls)} videos")
 
-                time.sleep(0.5)
+                    if self.rate_limit_delay > 0:
+                        time.sleep(self.rate_limit_delay)
 
             self.progress.emit(100, "Complete!")
 
@@ -785,143 +1111,336 @@ class InstagramScraperThread(QThread):
             self.finished.emit(False, str(e), [])
 
 
+class ThumbnailCache:
+    """Persistent on-disk thumbnail cache keyed by URL hash"""
+    MAX_AGE = 7 * 86400  # seconds
+
+    def __init__(self):
+        base = QStandardPaths.writableLocation(QStandardPaths.CacheLocation) or '.cache'
+        self.directory = os.path.join(base, 'thumbs')
+
+    def get_path(self, url):
+        digest = hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+        return os.path.join(self.directory, digest[:2], digest)
+
+    def read(self, url):
+        path = self.get_path(url)
+        try:
+            if time.time() - os.path.getmtime(path) < self.MAX_AGE:
+                with open(path, 'rb') as f:
+                    return f.read()
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+
+    def prune(self):
+        """Delete entries (and orphaned temp files) older than MAX_AGE"""
+        cutoff = time.time() - self.MAX_AGE
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    if os.path.getmtime(path) < cutoff:
+                        os.remove(path)
+                except OSError:
+                    pass
+
+    def write(self, url, data):
+        path = self.get_path(url)
+        tmp = path + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError as e:
+            logging.warning(f"Failed to cache thumbnail: {e}")
+
+
+class ThumbnailLoader(QObject):
+    """Fetches thumbnails on a small worker pool and hands them back on the GUI thread"""
+    thumbnail_ready = pyqtSignal(str, QImage)
+    VISIBLE, PREFETCH = 0, 1  # queue priorities; on-screen thumbnails go first
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, max_workers=8):
+        super().__init__()
+        self.cache = ThumbnailCache()
+        self.pending = {}  # url -> widgets waiting for it
+        self.queue = PriorityQueue()
+        self._seq = count()
+        self._lock = Lock()
+        self._unclaimed = {}  # url -> (token, priority) until a worker picks it up
+        self.thumbnail_ready.connect(self._deliver)
+
+        self.workers = [Thread(target=self._work, daemon=True) for _ in range(max_workers)]
+        for worker in self.workers:
+            worker.start()
+        Thread(target=self.cache.prune, daemon=True).start()
+
+    def request(self, url, widget, priority=PREFETCH):
+        waiting = self.pending.get(url)
+        if waiting is not None:
+            waiting.append(widget)
+            return
+        self.pending[url] = [widget]
+        token = next(self._seq)
+        with self._lock:
+            self._unclaimed[url] = (token, priority)
+        self.queue.put((priority, token, url, token))
+
+    def promote(self, url):
+        """Move a still-queued prefetch to the front now that its card is on screen"""
+        with self._lock:
+            entry = self._unclaimed.get(url)
+            if entry is None or entry[1] == self.VISIBLE:
+                return
+            self._unclaimed[url] = (entry[0], self.VISIBLE)
+        # The old entry stays queued; whichever copy a worker pops first claims the token
+        self.queue.put((self.VISIBLE, next(self._seq), url, entry[0]))
+
+    def discard(self, widget):
+        for waiting in self.pending.values():
+            if widget in waiting:
+                waiting.remove(widget)
+
+    def shutdown(self):
+        self.pending.clear()
+        # Sentinels sort ahead of any queued work so workers exit promptly
+        for _ in self.workers:
+            self.queue.put((-1, next(self._seq), None, None))
+
+    def _work(self):
+        while True:
+            _, _, url, token = self.queue.get()
+            if url is None:
+                return
+            with self._lock:
+                entry = self._unclaimed.get(url)
+                if entry is None or entry[0] != token:
+                    continue
+                del self._unclaimed[url]
+            self._fetch(url)
+
+    def _fetch(self, url):
+        data = self.cache.read(url)
+        if data is None:
+            try:
+                response = HTTP.get(url, timeout=5)
+                data = response.content if response.ok else b''
+                response.close()
+                if data:
+                    self.cache.write(url, data)
+            except Exception as e:
+                logging.warning(f"Thumbnail fetch failed: {e}")
+                data = b''
+
+        # Decode and scale here; only QPixmap creation must happen on the GUI thread
+        image = QImage()
+        try:
+            if data and image.loadFromData(data):
+                image = image.scaled(200, 200, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        except Exception as e:
+            logging.warning(f"Thumbnail decode failed: {e}")
+            image = QImage()
+        self.thumbnail_ready.emit(url, image)
+
+    @staticmethod
+    def pixmap_key(url):
+        return hashlib.blake2b(url.encode('utf-8'), digest_size=8).hexdigest()
+
+    @classmethod
+    def cached_pixmap(cls, url):
+        """Return the decoded thumbnail from QPixmapCache, or None"""
+        pixmap = QPixmapCache.find(cls.pixmap_key(url))
+        if pixmap is None or pixmap.isNull():
+            return None
+        return pixmap
+
+    def _deliver(self, url, image):
+        widgets = self.pending.pop(url, [])
+        if image.isNull():
+            return
+
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(self.pixmap_key(url), pixmap)
+        for widget in widgets:
+            try:
+                widget.set_thumbnail(pixmap)
+            except RuntimeError:
+                # Widget was deleted while the fetch was in flight
+                pass
+
+
 class VideoWidget(QFrame):
-    def __init__(self, video_info, parent=None):
+    _placeholder_pixmap = None  # shared by every widget via implicit sharing
+
+    def __init__(self, video_info, parent=None, thumbnail_priority=ThumbnailLoader.PREFETCH):
         super().__init__(parent)
         self.video_info = video_info
         self.download_status = None
-        self.thumbnail_pixmap = None
+        self.thumbnail_priority = thumbnail_priority
         self.setup_ui()
 
     def setup_ui(self):
         self.setFrameStyle(QFrame.StyledPanel | QFrame.Raised)
-        self.setStyleSheet("""
-            VideoWidget {
-                background-color: #2d2d2d;
-                border: 2px solid #3d3d3d;
-                border-radius: 8px;
-                padding: 10px;
-            }
-            VideoWidget:hover {
-                border: 2px solid #0095f6;
-            }
-            VideoWidget[downloaded="true"] {
-                background-color: #1a3a2a;
-                border: 2px solid #00d26a;
-            }
-            VideoWidget[failed="true"] {
-                background-color: #3a1a1a;
-                border: 2px solid #ff4444;
-            }
-        """)
+
+        # Card-wide state colours live on this backdrop so a state change re-polishes it alone
+        self.state_frame = QFrame(self)
+        self.state_frame.setObjectName("cardState")
+        self.state_frame.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.state_frame.lower()
+        self.state_frame.hide()
 
         layout = QVBoxLayout()
         layout.setSpacing(8)
 
         self.status_indicator = QLabel()
+        self.status_indicator.setObjectName("statusIndicator")
         self.status_indicator.setAlignment(Qt.AlignCenter)
-        self.status_indicator.setStyleSheet("""
-            QLabel {
-                background-color: rgba(0, 0, 0, 0.7);
-                color: white;
-                font-size: 11px;
-                font-weight: bold;
-                padding: 4px 8px;
-                border-radius: 4px;
-            }
-        """)
         self.status_indicator.hide()
 
         self.thumbnail_label = QLabel()
         self.thumbnail_label.setFixedSize(200, 200)
+        self.thumbnail_label.setObjectName("thumbnail")
         self.thumbnail_label.setAlignment(Qt.AlignCenter)
-        self.thumbnail_label.setStyleSheet("background-color: #1a1a1a; border-radius: 4px;")
         self.load_thumbnail()
         layout.addWidget(self.thumbnail_label, alignment=Qt.AlignCenter)
 
         self.checkbox = QCheckBox()
         self.checkbox.setChecked(True)
-        self.checkbox.setStyleSheet("""
-            QCheckBox::indicator {
-                width: 20px;
-                height: 20px;
-                border-radius: 4px;
-                border: 2px solid #0095f6;
-                background-color: #2d2d2d;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #0095f6;
-            }
-        """)
         layout.addWidget(self.checkbox)
         layout.addWidget(self.status_indicator)
 
-        title = self.video_info['title'][:60] + ('...' if len(self.video_info['title']) > 60 else '')
-        title_label = QLabel(title)
+        title_label = QLabel(_short(self.video_info['title'], 60))
+        title_label.setObjectName("videoTitle")
         title_label.setWordWrap(True)
-        title_label.setStyleSheet("color: #ffffff; font-size: 12px; font-weight: bold;")
         layout.addWidget(title_label)
 
-        url_short = self.video_info['url'][:40] + '...' if len(self.video_info['url']) > 40 else self.video_info['url']
-        url_label = QLabel(f"🔗 {url_short}")
-        url_label.setStyleSheet("color: #8e8e8e; font-size: 10px;")
+        url_label = QLabel(f"🔗 {_short(self.video_info['url'], 40)}")
+        url_label.setObjectName("videoUrl")
         layout.addWidget(url_label)
 
         self.setLayout(layout)
 
     def load_thumbnail(self):
-        try:
-            thumbnail_url = self.video_info.get('thumbnail', '')
-            if thumbnail_url:
-                response = requests.get(thumbnail_url, timeout=5)
-                image_data = BytesIO(response.content)
-
-                self.thumbnail_pixmap = QPixmap()
-                self.thumbnail_pixmap.loadFromData(image_data.getvalue())
-
-                scaled_pixmap = self.thumbnail_pixmap.scaled(200, 200, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                self.thumbnail_label.setPixmap(scaled_pixmap)
+        """Show a placeholder and queue the real thumbnail on the shared loader"""
+        self.show_placeholder()
+        thumbnail_url = self.video_info.get('thumbnail', '')
+        if thumbnail_url:
+            pixmap = ThumbnailLoader.cached_pixmap(thumbnail_url)
+            if pixmap is not None:
+                self.set_thumbnail(pixmap)
+                return
+            ThumbnailLoader.instance().request(thumbnail_url, self, self.thumbnail_priority)
 
-                image_data.close()
-                response.close()
-            else:
-                self.thumbnail_label.setText("📹")
-                self.thumbnail_label.setStyleSheet("color: #666666; font-size: 48px; background-color: #1a1a1a;")
-        except:
-            self.thumbnail_label.setText("📹")
-            self.thumbnail_label.setStyleSheet("color: #666666; font-size: 48px; background-color: #1a1a1a;")
+    def promote_thumbnail(self):
+        """Bump a prefetched thumbnail to visible priority once the card is on screen"""
+        if self.thumbnail_priority == ThumbnailLoader.VISIBLE:
+            return
+        self.thumbnail_priority = ThumbnailLoader.VISIBLE
+        thumbnail_url = self.video_info.get('thumbnail', '')
+        if thumbnail_url and ThumbnailLoader._instance is not None:
+            ThumbnailLoader._instance.promote(thumbnail_url)
+
+    @classmethod
+    def placeholder_pixmap(cls):
+        if cls._placeholder_pixmap is None:
+            pixmap = QPixmap(200, 200)
+            pixmap.fill(QColor("#1a1a1a"))
+            painter = QPainter(pixmap)
+            font = painter.font()
+            font.setPixelSize(48)
+            painter.setFont(font)
+            painter.setPen(QColor("#666666"))
+            painter.drawText(pixmap.rect(), Qt.AlignCenter, "📹")
+            painter.end()
+            cls._placeholder_pixmap = pixmap
+        return cls._placeholder_pixmap
+
+    def show_placeholder(self):
+        self.thumbnail_label.setPixmap(self.placeholder_pixmap())
+
+    def set_thumbnail(self, pixmap):
+        """Called on the GUI thread with the decoded, already-scaled thumbnail"""
+        self.thumbnail_label.setPixmap(pixmap)
 
     def is_selected(self):
         return self.checkbox.isChecked()
 
+    def set_selected(self, selected, notify=True):
+        blocked = self.checkbox.blockSignals(not notify)
+        self.checkbox.setChecked(selected)
+        self.checkbox.blockSignals(blocked)
+
+    def resizeEvent(self, event):
+        self.state_frame.setGeometry(self.rect())
+        super().resizeEvent(event)
+
     def mark_downloaded(self):
         self.download_status = 'success'
-        self.setProperty("downloaded", "true")
-        self.style().unpolish(self)
-        self.style().polish(self)
+        set_style_state(self.state_frame, "state", "downloaded")
+        self.state_frame.show()
         self.status_indicator.setText("✓ DOWNLOADED")
-        self.status_indicator.setStyleSheet("background-color: #00d26a; color: white; font-weight: bold; padding: 4px 8px; border-radius: 4px;")
+        set_style_state(self.status_indicator, "state", "downloaded")
         self.status_indicator.show()
-        self.checkbox.setChecked(False)
+        self.set_selected(False, notify=False)
 
     def mark_failed(self):
         self.download_status = 'failed'
-        self.setProperty("failed", "true")
-        self.style().unpolish(self)
-        self.style().polish(self)
+        set_style_state(self.state_frame, "state", "failed")
+        self.state_frame.show()
         self.status_indicator.setText("✗ FAILED")
-        self.status_indicator.setStyleSheet("background-color: #ff4444; color: white; font-weight: bold; padding: 4px 8px; border-radius: 4px;")
+        set_style_state(self.status_indicator, "state", "failed")
         self.status_indicator.show()
 
     def cleanup(self):
-        if self.thumbnail_pixmap:
-            del self.thumbnail_pixmap
+        if ThumbnailLoader._instance is not None:
+            ThumbnailLoader._instance.discard(self)
+        self.thumbnail_label.clear()
+
+
+class VideoPlaceholder(QFrame):
+    """Cheap stand-in for a VideoWidget that hasn't been scrolled into view yet"""
+    def __init__(self, video_info, parent=None):
+        super().__init__(parent)
+        self.video_info = video_info
+        self.download_status = None
+        self.selected = True
+        self.setMinimumSize(240, 320)
+
+    def is_selected(self):
+        return self.selected
+
+    def set_selected(self, selected, notify=True):
+        self.selected = selected
+
+    def mark_downloaded(self):
+        self.download_status = 'success'
+        self.selected = False
+
+    def mark_failed(self):
+        self.download_status = 'failed'
+
+    def cleanup(self):
+        pass
 
 
 class InstagramBatchDownloader(QMainWindow):
     def __init__(self):
         super().__init__()
         self.video_widgets = []
+        self.video_index = {}  # video id -> position in video_widgets
+        self.n_selected = 0
+        self.n_downloaded = 0
+        self.n_failed = 0
         self.config = Config()
         self.save_directory = self.config.data['save_directory']
         self.info_thread = None
@@ -929,63 +1448,20 @@ class InstagramBatchDownloader(QMainWindow):
         self.profile_thread = None
         self.version_check_thread = None
         self.state_lock = Lock()
+        self._disk_cache = (0.0, None)  # (timestamp, directory) of the last disk check
+        self._ytdlp_ready = Event()
         self.init_ui()
 
+        # Pay yt-dlp's one-time setup cost while the user is still pasting URLs
+        Thread(target=self._warmup_ytdlp, daemon=True).start()
+        Thread(target=self._preconnect, daemon=True).start()
+
         # Check for updates on startup
         self.check_for_updates_auto()
 
     def init_ui(self):
         self.setWindowTitle(f"SpeiiKhiev Video Downloader v{CURRENT_VERSION}")
         self.setGeometry(100, 100, 1200, 800)
-        self.setStyleSheet("""
-            QMainWindow, QWidget {
-                background-color: #1a1a1a;
-                color: #ffffff;
-                font-family: 'Segoe UI', Arial;
-            }
-            QLineEdit, QPlainTextEdit {
-                background-color: #2d2d2d;
-                border: 2px solid #3d3d3d;
-                border-radius: 8px;
-                padding: 12px;
-                color: #ffffff;
-            }
-            QLineEdit:focus, QPlainTextEdit:focus { border: 2px solid #0095f6; }
-            QPushButton {
-                background-color: #0095f6;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 12px 24px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background-color: #0081d8; }
-            QPushButton:disabled { background-color: #3d3d3d; color: #666666; }
-            QPushButton#secondaryBtn { background-color: #3d3d3d; }
-            QPushButton#secondaryBtn:hover { background-color: #4d4d4d; }
-            QPushButton#updateBtn {
-                background-color: #00d26a;
-                color: white;
-            }
-            QPushButton#updateBtn:hover {
-                background-color: #00b85a;
-            }
-            QProgressBar {
-                border: 2px solid #3d3d3d;
-                border-radius: 8px;
-                background-color: #2d2d2d;
-                text-align: center;
-                height: 30px;
-            }
-            QProgressBar::chunk { background-color: #0095f6; border-radius: 6px; }
-            QTextEdit {
-                background-color: #2d2d2d;
-                border: 2px solid #3d3d3d;
-                border-radius: 8px;
-                padding: 10px;
-                color: #ffffff;
-            }
-        """)
 
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -1029,27 +1505,6 @@ class InstagramBatchDownloader(QMainWindow):
 
         # Tab widget
         self.tab_widget = QTabWidget()
-        self.tab_widget.setStyleSheet("""
-            QTabWidget::pane {
-                border: 2px solid #3d3d3d;
-                border-radius: 8px;
-                background-color: #1a1a1a;
-            }
-            QTabBar::tab {
-                background-color: #2d2d2d;
-                color: #ffffff;
-                padding: 10px 20px;
-                margin-right: 2px;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-            }
-            QTabBar::tab:selected {
-                background-color: #0095f6;
-            }
-            QTabBar::tab:hover {
-                background-color: #3d3d3d;
-            }
-        """)
 
         # Tab 1: Individual URLs
         urls_tab = QWidget()
@@ -1162,6 +1617,19 @@ class InstagramBatchDownloader(QMainWindow):
         self.scroll_area.setWidget(self.videos_container)
         main_layout.addWidget(self.scroll_area)
 
+        # Coalesce bursts of checkbox changes into one count update per event-loop pass
+        self._count_timer = QTimer(self)
+        self._count_timer.setSingleShot(True)
+        self._count_timer.timeout.connect(self._do_update_selection_count)
+
+        # Build real VideoWidgets only once their cell nears the viewport
+        self._materialize_timer = QTimer(self)
+        self._materialize_timer.setSingleShot(True)
+        self._materialize_timer.timeout.connect(self.materialize_visible)
+        scroll_bar = self.scroll_area.verticalScrollBar()
+        scroll_bar.valueChanged.connect(lambda *_: self._materialize_timer.start(0))
+        scroll_bar.rangeChanged.connect(lambda *_: self._materialize_timer.start(0))
+
         # Download controls
         download_layout = QHBoxLayout()
 
@@ -1211,30 +1679,47 @@ class InstagramBatchDownloader(QMainWindow):
         counters_layout.addStretch()
 
         self.downloaded_label = QLabel("Downloaded: 0")
-        self.downloaded_label.setStyleSheet("color: #8e8e8e; font-weight: bold;")
+        self.downloaded_label.setObjectName("downloadedCounter")
         counters_layout.addWidget(self.downloaded_label)
 
         self.failed_label = QLabel("Failed: 0")
-        self.failed_label.setStyleSheet("color: #8e8e8e; font-weight: bold;")
+        self.failed_label.setObjectName("failedCounter")
         counters_layout.addWidget(self.failed_label)
 
         self.disk_space_label = QLabel()
-        self.disk_space_label.setStyleSheet("color: #8e8e8e; font-size: 10px;")
+        self.disk_space_label.setObjectName("diskSpace")
         counters_layout.addWidget(self.disk_space_label)
         self.update_disk_space()
 
         main_layout.addLayout(counters_layout)
 
         # Status log
-        self.status_text = QTextEdit()
+        self.status_text = QPlainTextEdit()
+        self.status_text.setObjectName("statusLog")
         self.status_text.setReadOnly(True)
+        self.status_text.setMaximumBlockCount(500)
         self.status_text.setMaximumHeight(100)
-        self.status_text.append("✓ Ready - Paste video URLs and click Load Videos")
-        self.status_text.append("💡 Works with Instagram, YouTube, TikTok, and 1000+ sites!")
+        self.status_text.appendPlainText("✓ Ready - Paste video URLs and click Load Videos")
+        self.status_text.appendPlainText("💡 Works with Instagram, YouTube, TikTok, and 1000+ sites!")
         main_layout.addWidget(self.status_text)
 
         central_widget.setLayout(main_layout)
 
+    def _warmup_ytdlp(self):
+        try:
+            yt_dlp.YoutubeDL({'quiet': True, 'no_warnings': True, 'skip_download': True}).close()
+        except Exception as e:
+            logging.warning(f"yt-dlp warm-up failed: {e}")
+        finally:
+            self._ytdlp_ready.set()
+
+    def _preconnect(self):
+        for url in PRECONNECT_URLS:
+            try:
+                HTTP.head(url, timeout=2)
+            except Exception:
+                pass
+
     def check_for_updates_auto(self):
         """Check for updates automatically on startup"""
         # Check only once per day
@@ -1271,8 +1756,7 @@ class InstagramBatchDownloader(QMainWindow):
         self.version_check_thread.start()
 
         # Update last check time
-        self.config.data['last_update_check'] = time.time()
-        self.config.save()
+        self.config.set('last_update_check', time.time())
 
     def on_update_available(self, new_version, download_url, changelog, silent):
         """Handle update available"""
@@ -1318,22 +1802,27 @@ class InstagramBatchDownloader(QMainWindow):
 
     def update_disk_space(self):
         """Update disk space indicator"""
+        checked_at, directory = self._disk_cache
+        if directory == self.save_directory and time.time() - checked_at < 5:
+            return
+
         try:
             has_space, free_mb = SecurityUtils.check_disk_space(self.save_directory)
             free_gb = free_mb / 1024
 
             if free_gb < 1:
-                color = "#ff4444"
+                level = "low"
                 text = f"⚠️ {free_mb:.0f}MB free"
             elif free_gb < 5:
-                color = "#ff9500"
+                level = "warn"
                 text = f"💾 {free_gb:.1f}GB free"
             else:
-                color = "#00d26a"
+                level = "ok"
                 text = f"💾 {free_gb:.1f}GB free"
 
             self.disk_space_label.setText(text)
-            self.disk_space_label.setStyleSheet(f"color: {color}; font-size: 10px; font-weight: bold;")
+            set_style_state(self.disk_space_label, "level", level)
+            self._disk_cache = (time.time(), self.save_directory)
         except:
             pass
 
@@ -1376,7 +1865,8 @@ class InstagramBatchDownloader(QMainWindow):
         self.progress_bar.setValue(0)
         self.log_status(f"\n🔍 Fetching profile: {url}")
 
-        self.profile_thread = ProfileFetchThread(url, max_videos)
+        instagram_delay = self.config.data.get('instagram_delay', 0.5)
+        self.profile_thread = ProfileFetchThread(url, max_videos, instagram_delay)
         self.profile_thread.progress.connect(self.progress_bar.setValue)
         self.profile_thread.status_update.connect(self.log_status)
         self.profile_thread.finished.connect(self.profile_fetched)
@@ -1405,11 +1895,11 @@ class InstagramBatchDownloader(QMainWindow):
             QMessageBox.warning(self, "Error", "Please paste video URLs")
             return
 
-        urls = [url.strip() for url in urls_text.split('\n') if url.strip()]
+        urls = [url for url in map(str.strip, urls_text.splitlines()) if url]
         if not urls:
             return
 
-        valid_urls = [url for url in urls if SecurityUtils.is_valid_url(url)]
+        valid_urls = list(filter(SecurityUtils.is_valid_url, urls))
 
         if len(valid_urls) < len(urls):
             QMessageBox.warning(
@@ -1427,7 +1917,7 @@ class InstagramBatchDownloader(QMainWindow):
         self.progress_bar.setValue(0)
         self.log_status(f"\n📥 Loading {len(valid_urls)} video(s)...")
 
-        self.info_thread = VideoInfoThread(valid_urls)
+        self.info_thread = VideoInfoThread(valid_urls, ready=self._ytdlp_ready)
         self.info_thread.progress.connect(self.progress_bar.setValue)
         self.info_thread.status_update.connect(self.log_status)
         self.info_thread.finished.connect(self.videos_loaded)
@@ -1450,55 +1940,109 @@ class InstagramBatchDownloader(QMainWindow):
 
     def display_videos(self, videos):
         """Display videos in grid"""
-        for i in reversed(range(self.videos_layout.count())):
-            widget = self.videos_layout.itemAt(i).widget()
-            if widget:
-                widget.cleanup()
-                widget.setParent(None)
-
-        self.video_widgets.clear()
-        row, col = 0, 0
+        self._remove_video_widgets()
 
-        for video in videos:
-            widget = VideoWidget(video)
-            widget.checkbox.stateChanged.connect(self.update_selection_count)
-            self.video_widgets.append(widget)
-            self.videos_layout.addWidget(widget, row, col)
-            col += 1
-            if col >= 3:
-                col, row = 0, row + 1
+        for index, video in enumerate(videos):
+            placeholder = VideoPlaceholder(video)
+            self.video_widgets.append(placeholder)
+            self.video_index.setdefault(video['id'], index)
+            row, col = divmod(index, 3)
+            self.videos_layout.addWidget(placeholder, row, col)
 
+        self.n_selected = len(self.video_widgets)
         self.update_selection_count()
+        self._materialize_timer.start(0)
+
+    def materialize_visible(self):
+        """Replace placeholders within one viewport of the visible area with real widgets"""
+        self.videos_layout.activate()
+        if self.videos_container.height() < self.videos_container.minimumSizeHint().height():
+            # The scroll area hasn't resized the grid yet, so every cell would look on-screen;
+            # rangeChanged re-arms the timer once it has
+            return
+        height = self.scroll_area.viewport().height()
+        top = self.scroll_area.verticalScrollBar().value()
+        width = self.videos_container.width()
+        visible = QRect(0, top, width, height)
+        window = QRect(0, top - height, width, height * 3)
+
+        for index, widget in enumerate(self.video_widgets):
+            geometry = widget.geometry()
+            if not isinstance(widget, VideoPlaceholder):
+                if geometry.intersects(visible):
+                    widget.promote_thumbnail()
+                continue
+            if geometry.intersects(visible):
+                self._materialize(index, ThumbnailLoader.VISIBLE)
+            elif geometry.intersects(window):
+                self._materialize(index, ThumbnailLoader.PREFETCH)
+
+    def _materialize(self, index, thumbnail_priority):
+        placeholder = self.video_widgets[index]
+        widget = VideoWidget(placeholder.video_info, thumbnail_priority=thumbnail_priority)
+        if placeholder.download_status == 'success':
+            widget.mark_downloaded()
+        elif placeholder.download_status == 'failed':
+            widget.mark_failed()
+        widget.set_selected(placeholder.is_selected())
+        widget.checkbox.toggled.connect(self._on_selection_toggled)
+
+        self.videos_layout.removeWidget(placeholder)
+        placeholder.setParent(None)
+        placeholder.deleteLater()
+
+        row, col = divmod(index, 3)
+        self.videos_layout.addWidget(widget, row, col)
+        self.video_widgets[index] = widget  # same slot, so video_index stays valid
 
     def clear_videos(self):
         """Clear all videos"""
-        for i in reversed(range(self.videos_layout.count())):
-            widget = self.videos_layout.itemAt(i).widget()
-            if widget:
-                widget.cleanup()
-                widget.setParent(None)
+        self._remove_video_widgets()
+        self.update_selection_count()
+
+    def _remove_video_widgets(self):
+        for widget in self.video_widgets:
+            widget.cleanup()
+            widget.setParent(None)
+            widget.deleteLater()
         self.video_widgets.clear()
+        self.video_index.clear()
+        self.n_selected = self.n_downloaded = self.n_failed = 0
+
+    def _on_selection_toggled(self, checked):
+        self.n_selected += 1 if checked else -1
         self.update_selection_count()
 
     def update_selection_count(self):
+        """Schedule a selection count update"""
+        if not self._count_timer.isActive():
+            self._count_timer.start(0)
+
+    def _do_update_selection_count(self):
         """Update selection count"""
+        self._count_timer.stop()
         total = len(self.video_widgets)
-        selected = sum(1 for w in self.video_widgets if w.is_selected())
-        self.video_count_label.setText(f"Videos: {total} | Selected: {selected}")
-        self.download_btn.setEnabled(selected > 0)
+        self.video_count_label.setText(f"Videos: {total} | Selected: {self.n_selected}")
+        self.download_btn.setEnabled(self.n_selected > 0)
 
     def select_all(self):
         for w in self.video_widgets:
-            w.checkbox.setChecked(True)
+            w.set_selected(True, notify=False)
+        self.n_selected = len(self.video_widgets)
+        self._do_update_selection_count()
 
     def deselect_all(self):
         for w in self.video_widgets:
-            w.checkbox.setChecked(False)
+            w.set_selected(False, notify=False)
+        self.n_selected = 0
+        self._do_update_selection_count()
 
     def reset_selection(self):
         for w in self.video_widgets:
-            if w.download_status == 'success':
-                w.checkbox.setChecked(False)
+            if w.download_status == 'success' and w.is_selected():
+                w.set_selected(False, notify=False)
+                self.n_selected -= 1
+        self._do_update_selection_count()
 
     def browse_directory(self):
         """Browse for save directory"""
@@ -1506,8 +2050,8 @@ class InstagramBatchDownloader(QMainWindow):
         if directory:
             self.save_directory = directory
             self.location_input.setText(directory)
-            self.config.data['save_directory'] = directory
-            self.config.save()
+            self.config.set('save_directory', directory)
+            self._disk_cache = (0.0, None)
             self.update_disk_space()
 
     def start_download(self):
@@ -1533,7 +2077,8 @@ class InstagramBatchDownloader(QMainWindow):
         self.log_status(f"\n⬇️ Downloading {len(selected)} video(s)...")
 
         format_index = self.filename_format.currentIndex()
-        self.download_thread = DownloadThread(selected, self.save_directory, format_index, 2)
+        max_concurrent = self.config.data.get('max_concurrent', DEFAULT_MAX_CONCURRENT)
+        self.download_thread = DownloadThread(selected, self.save_directory, format_index, 2, max_concurrent)
         self.download_thread.status_update.connect(self.log_status)
         self.download_thread.finished.connect(self.video_downloaded)
         self.download_thread.start()
@@ -1542,10 +2087,9 @@ class InstagramBatchDownloader(QMainWindow):
         """Handle video download completion"""
         self.log_status(message)
 
-        for w in self.video_widgets:
-            if w.video_info['id'] == video_id:
-                w.mark_downloaded() if success else w.mark_failed()
-                break
+        index = self.video_index.get(video_id)
+        if index is not None:
+            self._set_download_status(self.video_widgets[index], success)
 
         self.update_counters()
 
@@ -1554,32 +2098,50 @@ class InstagramBatchDownloader(QMainWindow):
             self.download_btn.setEnabled(True)
             self.update_selection_count()
 
-            downloaded = sum(1 for w in self.video_widgets if w.download_status == 'success')
-            failed = sum(1 for w in self.video_widgets if w.download_status == 'failed')
-
             QMessageBox.information(
                 self,
                 "Complete",
-                f"✓ Downloaded: {downloaded}\n✗ Failed: {failed}"
+                f"✓ Downloaded: {self.n_downloaded}\n✗ Failed: {self.n_failed}"
             )
 
+    def _set_download_status(self, widget, success):
+        """Mark a widget and keep the selected/downloaded/failed counters in step"""
+        old_status = widget.download_status
+        was_selected = widget.is_selected()
+
+        widget.mark_downloaded() if success else widget.mark_failed()
+
+        if old_status == 'success':
+            self.n_downloaded -= 1
+        elif old_status == 'failed':
+            self.n_failed -= 1
+        if success:
+            self.n_downloaded += 1
+        else:
+            self.n_failed += 1
+
+        if was_selected and not widget.is_selected():
+            self.n_selected -= 1
+            self.update_selection_count()
+
     def update_counters(self):
         """Update download counters"""
-        downloaded = sum(1 for w in self.video_widgets if w.download_status == 'success')
-        failed = sum(1 for w in self.video_widgets if w.download_status == 'failed')
+        self.downloaded_label.setText(f"Downloaded: {self.n_downloaded}")
+        set_style_state(self.downloaded_label, "active", self.n_downloaded > 0)
 
-        self.downloaded_label.setText(f"Downloaded: {downloaded}")
-        self.downloaded_label.setStyleSheet(f"color: {'#00d26a' if downloaded > 0 else '#8e8e8e'}; font-weight: bold;")
-
-        self.failed_label.setText(f"Failed: {failed}")
-        self.failed_label.setStyleSheet(f"color: {'#ff4444' if failed > 0 else '#8e8e8e'}; font-weight: bold;")
+        self.failed_label.setText(f"Failed: {self.n_failed}")
+        set_style_state(self.failed_label, "active", self.n_failed > 0)
 
         self.update_disk_space()
 
     def log_status(self, message):
         """Log status message"""
-        self.status_text.append(message)
-        self.status_text.verticalScrollBar().setValue(self.status_text.verticalScrollBar().maximum())
+        scroll_bar = self.status_text.verticalScrollBar()
+        at_bottom = scroll_bar.value() == scroll_bar.maximum()
+        self.status_text.appendPlainText(message)
+        # Follow new output, but don't yank the view if the user scrolled back
+        if at_bottom:
+            scroll_bar.setValue(scroll_bar.maximum())
 
     def closeEvent(self, event):
         """Handle application close"""
@@ -1590,15 +2152,21 @@ class InstagramBatchDownloader(QMainWindow):
         if self.profile_thread and self.profile_thread.isRunning():
             self.profile_thread.stop()
 
-        for widget in self.video_widgets:
-            widget.cleanup()
+        # Let Qt tear the grid down in C++ instead of cleaning up each card
+        if ThumbnailLoader._instance is not None:
+            ThumbnailLoader._instance.shutdown()
+        self.videos_container.deleteLater()
+        HTTP.close()
 
-        self.config.save()
+        self.config.flush()
         event.accept()
 
 
 def main():
     app = QApplication(sys.argv)
+    app.setApplicationName("SpeiiKhievDownloader")
+    app.setStyleSheet(STYLE)
+    QPixmapCache.setCacheLimit(64 * 1024)  # KB
 
     try:
         window = InstagramBatchDownloader()